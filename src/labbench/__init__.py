@@ -24,8 +24,10 @@ from ._backends import (
     VISADevice,
     Win32ComDevice,
     shell_options_from_keyed_values,
+    visa_clear_probe_cache,
     visa_default_resource_manager,
     visa_list_resources,
+    visa_probe_cache_path,
     visa_probe_devices,
 )
 from ._data import CSVLogger, SQLiteLogger, read, read_relational
@@ -1,6 +1,7 @@
 import contextlib
 import importlib
 import inspect
+import json
 import logging
 import os
 import platform
@@ -12,20 +13,24 @@ import warnings
 from collections import OrderedDict
 from pathlib import Path
 from queue import Empty, Queue
-from threading import Event, Thread
+from threading import Event, RLock, Thread
 from typing import Union, Literal
 import typing
 
 from . import paramattr as attr
 from . import util
 from ._device import Device
+from .paramattr._bases import get_key_adapter
+from .paramattr._key_adapters import _group_messages
 
 if typing.TYPE_CHECKING:
+    import numpy as np
     import psutil
     import pyvisa
     import serial
     import subprocess as sp
 else:
+    np = util.lazy_import('numpy')
     psutil = util.lazy_import('psutil')
     pyvisa = util.lazy_import('pyvisa')
     serial = util.lazy_import('serial')
@@ -996,6 +1001,44 @@ def visa_timeout_context(resource, timeout: float | None = None):
     )
 
 
+# pyvisa ascii converter codes that can be parsed in bulk by numpy
+_ASCII_CONVERTER_DTYPES = {
+    'f': 'float64',
+    'F': 'float64',
+    'e': 'float64',
+    'E': 'float64',
+    'g': 'float64',
+    'G': 'float64',
+    'd': 'int64',
+    'i': 'int64',
+}
+
+
+def _parse_ascii_values(
+    raw: bytes, dtype: str, separator: str, out: np.ndarray | None = None
+) -> np.ndarray:
+    """parse a separated sequence of ASCII numbers into an array"""
+    if len(raw) == 0:
+        values = np.empty(0, dtype=dtype)
+    else:
+        # numpy's C text parser, which raises ValueError on malformed values
+        values = np.loadtxt(
+            [raw.decode('ascii')],
+            dtype=dtype,
+            delimiter=separator if separator.strip() else None,
+            ndmin=1,
+        )
+
+    if out is None:
+        return values
+    elif out.size != values.size:
+        raise ValueError(
+            f'out has size {out.size}, but the reply contains {values.size} values'
+        )
+    np.copyto(out, values.reshape(out.shape), casting='same_kind')
+    return out
+
+
 @attr.visa_keying(
     query_fmt='{key}?', write_fmt='{key} {value}', remap={True: 'ON', False: 'OFF'}
 )
@@ -1125,6 +1168,7 @@ class VISADevice(Device):
 
     _rm = None  # set at runtime
     _opc = False
+    _batch_messages = None  # list of queued messages inside batch()
 
     # Overload methods as needed to implement RemoteDevice
     def open(self):
@@ -1163,7 +1207,9 @@ class VISADevice(Device):
                 ]
             ).replace('resource', 'serial number')
 
-            matches = visa_probe_devices(self)
+            matches = _visa_probe_cached(self)
+            if matches is None:
+                matches = visa_probe_devices(self)
 
             if len(matches) == 0:
                 msg = (
@@ -1249,11 +1295,83 @@ class VISADevice(Device):
         kws = {k: self._keying.to_message(v) for k, v in kws.items()}
         msg = msg.format(**kws)
 
+        if self._batch_messages is not None:
+            # inside batch()
+            self._batch_messages.append(msg)
+        else:
+            self._write_message(msg)
+
+    def _write_message(self, msg: str):
         # outbound message as truncated event log entry
         msg_out = repr(msg) if len(msg) < 1024 else f'({len(msg)} bytes)'
         self._logger.debug(f'write({msg_out})')
         self.backend.write(msg)
 
+    def _send_batch(self, query: str | None = None) -> str | None:
+        """send the messages queued by batch().
+
+        If `query` is given, it is joined with as many of the queued messages as fit
+        into one compound message, which is returned instead of written.
+        """
+        messages, self._batch_messages = self._batch_messages, []
+        if query is not None:
+            messages.append(query)
+
+        key_adapter = get_key_adapter(self)
+        separator = getattr(key_adapter, 'separator', ';')
+        max_length = getattr(key_adapter, 'max_message_length', None)
+
+        # separator=None leaves each message in its own group
+        groups = _group_messages(messages, separator, max_length)
+        joiner = separator or ''
+        if query is not None:
+            *groups, last = groups
+
+        for group in groups:
+            self._write_message(joiner.join(group))
+
+        if query is not None:
+            return joiner.join(last)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """context manager that queues messages from `write`, and sends them as compound messages.
+
+        This applies to sets of properties implemented with `key` and direct calls to
+        `write`. The queued messages are joined with the separator and maximum message
+        length configured in `labbench.paramattr.visa_keying`. They are sent on exit
+        from the block, or together with the next query. If an exception is raised inside
+        the block, the queued messages are discarded.
+
+        Compound queries can be made with `get_many`.
+
+        Example::
+
+            with inst.batch():
+                inst.frequency_center = 2.4e9
+                inst.frequency_span = 20e6
+                inst.write('INIT')
+        """
+
+        if self._batch_messages is not None:
+            # already batching
+            yield
+            return
+
+        self._batch_messages = []
+        try:
+            yield
+        except BaseException:
+            if len(self._batch_messages) > 0:
+                self._logger.debug(
+                    f'discarded {len(self._batch_messages)} messages queued in batch'
+                )
+            raise
+        else:
+            self._send_batch()
+        finally:
+            self._batch_messages = None
+
     def query(
         self,
         msg: str,
@@ -1277,6 +1395,10 @@ class VISADevice(Device):
         kws = {k: self._keying.to_message(v) for k, v in kws.items()}
         msg = msg.format(**kws)
 
+        if self._batch_messages:
+            # send pending messages from batch() along with the query
+            msg = self._send_batch(query=msg)
+
         # outbound message as truncated event log entry
         msg_out = repr(msg) if len(msg) < 80 else f'({len(msg)} bytes)'
         self._logger.debug(f'query({msg_out}):')
@@ -1318,21 +1440,69 @@ class VISADevice(Device):
         msg: str,
         converter='f',
         separator=',',
-        container=list,
+        container=None,
         delay=None,
         timeout=None,
+        out: np.ndarray | None = None,
     ):
+        """queries the device with an SCPI message, and parses its reply as
+        a separated sequence of ASCII values.
+
+        Numeric replies are read with a single `read_raw` call and converted
+        in bulk with `numpy.loadtxt`. Other converters and separators fall
+        back to `pyvisa.resources.MessageBasedResource.query_ascii_values`.
+
+        Arguments:
+            msg: the SCPI message to send
+            converter: pyvisa conversion code for each value ('f', 'e', 'g', 'd', 'i', 's', 'x', ...), or a callable
+            separator: the string that separates values, or a callable that splits the reply
+            container: type for the returned sequence (default: `numpy.ndarray`)
+            delay: time (in s) to wait between the write and the read, or None for `self.backend.query_delay`
+            timeout: overrides `self.timeout`
+            out: array to fill with the data (its size must match the reply), or None to allocate one
+
+        Returns:
+            `container` of the parsed values
+        """
+        if self._batch_messages:
+            self._send_batch()
+
         msg_out = repr(msg) if len(msg) < 80 else f'({len(msg)} bytes)'
         self._logger.debug(f'query_ascii_values({msg_out}):')
 
-        with visa_timeout_context(self.backend, timeout):
-            ret = self.backend.query_ascii_values(
-                msg,
-                converter=converter,
-                separator=separator,
-                container=container,
-                delay=delay,
-            )
+        dtype = _ASCII_CONVERTER_DTYPES.get(converter, None)
+        if container is None:
+            container = np.ndarray
+
+        if dtype is None or not isinstance(separator, str):
+            # pyvisa's general per-value converter
+            if out is not None:
+                raise TypeError(
+                    f'out is only supported for numeric converters, not {converter!r}'
+                )
+            with visa_timeout_context(self.backend, timeout):
+                ret = self.backend.query_ascii_values(
+                    msg,
+                    converter=converter,
+                    separator=separator,
+                    container=np.array if container is np.ndarray else container,
+                    delay=delay,
+                )
+        else:
+            with visa_timeout_context(self.backend, timeout):
+                self.backend.write(msg)
+                if delay is None:
+                    delay = self.backend.query_delay
+                if delay > 0:
+                    time.sleep(delay)
+                raw = self.backend.read_raw().strip()
+
+            ret = _parse_ascii_values(raw, dtype, separator, out)
+
+            if container is list:
+                ret = ret.tolist()
+            elif container is not np.ndarray:
+                ret = container(ret)
 
         # post debug
         if len(ret) < 80 and len(repr(ret)) < 80:
@@ -1348,6 +1518,77 @@ class VISADevice(Device):
 
         return ret
 
+    def query_binary_values(
+        self,
+        msg: str,
+        dtype: str = 'float32',
+        is_big_endian: bool = False,
+        out: np.ndarray | None = None,
+        expect_termination: bool = True,
+        timeout: float | None = None,
+    ) -> np.ndarray:
+        """queries the device with an SCPI message, and returns its reply
+        as an array decoded from an IEEE 488.2 definite-length binary block.
+
+        Arguments:
+            msg: the SCPI message to send
+            dtype: numpy data type of each element in the block
+            is_big_endian: the byte order of elements in the block
+            out: array to fill with the data (its size must match the block), or None to allocate one
+            expect_termination: if True, read the termination that follows the block
+            timeout: overrides `self.timeout`
+
+        Returns:
+            array with native byte order
+        """
+        if self._batch_messages:
+            self._send_batch()
+
+        msg_out = repr(msg) if len(msg) < 80 else f'({len(msg)} bytes)'
+        self._logger.debug(f'query_binary_values({msg_out}):')
+
+        block_dtype = np.dtype(dtype).newbyteorder('>' if is_big_endian else '<')
+
+        with visa_timeout_context(self.backend, timeout):
+            t0 = time.perf_counter()
+            self.backend.write(msg)
+
+            # the header: '#', number of length digits, and the length
+            header = self.backend.read_bytes(2)
+            if header[:1] != b'#' or not header[1:].isdigit() or header[1:] == b'0':
+                raise ValueError(
+                    f'expected an IEEE 488.2 definite-length block, but reply started with {header!r}'
+                )
+            size = int(self.backend.read_bytes(int(header[1:])))
+
+            if size % block_dtype.itemsize != 0:
+                raise ValueError(
+                    f'block size {size} is not a multiple of the {block_dtype} item size'
+                )
+            count = size // block_dtype.itemsize
+
+            data = self.backend.read_bytes(size)
+            if expect_termination and self.backend.read_termination:
+                self.backend.read_bytes(len(self.backend.read_termination))
+
+            elapsed = time.perf_counter() - t0
+
+        if out is None:
+            out = np.empty(count, dtype=block_dtype.newbyteorder('='))
+        elif out.size != count:
+            raise ValueError(
+                f'out has size {out.size}, but the reply block contains {count} values'
+            )
+        np.copyto(out, np.frombuffer(data, dtype=block_dtype).reshape(out.shape))
+
+        rate = f'{size / elapsed / 1e6:0.1f} MB/s' if elapsed > 0 else 'unknown rate'
+        self._logger.debug(
+            f'    → ({out.dtype} array with shape {out.shape}: '
+            f'{size} bytes in {elapsed:0.3f} s, {rate})'
+        )
+
+        return out
+
     def wait(self):
         """sends '*WAI' to wait for all commands to complete before continuing"""
         self.write('*WAI')
@@ -1530,6 +1771,175 @@ def visa_default_resource_manager(name: str = None):
     VISADevice._rm = name
 
 
+_visa_probe_cache_path = Path(
+    os.environ.get(
+        'LABBENCH_VISA_PROBE_CACHE',
+        Path.home() / '.cache' / 'labbench' / 'visa_probe.json',
+    )
+)
+_visa_probe_cache_lock = RLock()
+
+
+def visa_probe_cache_path(path: str | Path | None = ...) -> Path | None:
+    """get or set the file that keeps the results of `visa_probe_devices` between sessions.
+
+    `VISADevice.open` first checks the cached resources for a match before
+    falling back to a full probe. The default path can also be set by the
+    `LABBENCH_VISA_PROBE_CACHE` environment variable.
+
+    Arguments:
+        path: path to the JSON cache file, or None to disable caching (if unspecified, only returns the current path)
+
+    Returns:
+        the path to the cache file, or None if caching is disabled
+    """
+    global _visa_probe_cache_path
+
+    if path is not ...:
+        _visa_probe_cache_path = None if path is None else Path(path)
+
+    return _visa_probe_cache_path
+
+
+def visa_clear_probe_cache(resource_manager: str | None = None):
+    """remove cached results of `visa_probe_devices`.
+
+    Arguments:
+        resource_manager: clear only the entries of this resource manager, or None to clear all entries
+    """
+    with _visa_probe_cache_lock:
+        if _visa_probe_cache_path is None:
+            return
+        elif resource_manager is None:
+            _visa_probe_cache_path.unlink(missing_ok=True)
+        else:
+            cache = _visa_probe_cache_load()
+            if cache.pop(resource_manager, None) is not None:
+                _visa_probe_cache_save(cache)
+
+
+def _visa_probe_cache_load() -> dict[str, dict[str, dict]]:
+    """returns the probe cache as {resource_manager: {resource: entry}}"""
+    if _visa_probe_cache_path is None:
+        return {}
+
+    try:
+        with open(_visa_probe_cache_path) as fd:
+            cache = json.load(fd)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as ex:
+        util.logger.debug(f'ignoring unreadable VISA probe cache: {ex!s}')
+        return {}
+
+    if not isinstance(cache, dict):
+        return {}
+    return cache
+
+
+def _visa_probe_cache_save(cache: dict[str, dict[str, dict]]):
+    path = _visa_probe_cache_path
+    if path is None:
+        return
+
+    # write and then rename, so that other processes never read a partial file
+    temp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, 'w') as fd:
+            json.dump(cache, fd, indent=1)
+        os.replace(temp_path, path)
+    except OSError as ex:
+        util.logger.warning(
+            f'could not write VISA probe cache to {str(path)!r}: {ex!s}'
+        )
+
+
+def _visa_probe_cache_update(devices: dict[str, VISADevice | None]):
+    """replace the cache entries for each probed resource"""
+    if _visa_probe_cache_path is None:
+        return
+
+    with _visa_probe_cache_lock:
+        cache = _visa_probe_cache_load()
+        entries = cache.setdefault(str(VISADevice._rm), {})
+
+        for resource, device in devices.items():
+            if device is None:
+                entries.pop(resource, None)
+            else:
+                entries[resource] = dict(
+                    make=device.make,
+                    model=device.model,
+                    serial=device.serial,
+                    read_termination=device.read_termination,
+                    write_termination=device.write_termination,
+                    last_seen=time.time(),
+                )
+
+        _visa_probe_cache_save(cache)
+
+
+def _visa_probe_cached(
+    target: VISADevice, open_timeout: float = 0.5, timeout: float = 0.25
+) -> list[VISADevice] | None:
+    """look for target among the cached probe results.
+
+    The identity of a unique cached match is confirmed with a single '*IDN?'
+    query.
+
+    Returns:
+        a list containing the matching device, or None if a full probe is needed
+    """
+    if _visa_probe_cache_path is None:
+        return None
+
+    with _visa_probe_cache_lock:
+        entries = _visa_probe_cache_load().get(str(VISADevice._rm), {})
+
+    candidates = [
+        (resource, entry)
+        for resource, entry in entries.items()
+        if _visa_match_identity(target, entry['make'], entry['model'], entry['serial'])
+    ]
+
+    if len(candidates) != 1:
+        return None
+
+    resource, entry = candidates[0]
+    device = VISADevice(
+        resource,
+        open_timeout=open_timeout,
+        timeout=timeout,
+        read_termination=entry['read_termination'],
+        write_termination=entry['write_termination'],
+    )
+    device._logger = logging.getLogger()  # suppress the normal logger for probing
+
+    try:
+        device.open()
+        try:
+            identity = device.query('*IDN?')
+        finally:
+            device.close()
+    except (OSError, pyvisa.errors.Error):
+        return None
+
+    make, model, serial, *rev = _visa_parse_identity(identity)
+    if (make, model, serial) != (entry['make'], entry['model'], entry['serial']):
+        target._logger.debug(
+            f'cached identity of resource {resource!r} has changed; probing all resources'
+        )
+        return None
+
+    device.make = make
+    device.model = model
+    device._attr_store.cache.update(serial=serial, _revision=rev)
+    _visa_probe_cache_update({resource: device})
+
+    return [device]
+
+
 @util.locked_calls
 @util.ttl_cache(10)  # a cache of recent resource parameters
 def _visa_probe_resource(
@@ -1626,6 +2036,9 @@ def visa_probe_devices(
     if successful, query the instrument identity ('*IDN?'). Discovery will fail for
     devices that do not support this message.
 
+    The results for each probed resource are saved to the file given by
+    `visa_probe_cache_path`.
+
     Arguments:
         target: if specified, return only devices that match target.make and target.model
         skip_interfaces: do not probe interfaces that begin with these strings (case-insensitive)
@@ -1639,29 +2052,6 @@ def visa_probe_devices(
                 return False
         return True
 
-    def match_target(device):
-        if target is None:
-            return True
-
-        if target.make is not None:
-            # apply the make filter
-            if device.make.lower() != target.make.lower():
-                return False
-
-        if target.model is not None:
-            # apply the model filter
-            if not target.model.lower().startswith(device.model.lower()):
-                return False
-
-        if target.resource is not None and not _visa_valid_resource_name(
-            target.resource
-        ):
-            # treat the resource string as a serial number, and filter
-            if target.resource.lower() != device.serial.lower():
-                return False
-
-        return True
-
     calls = {
         res: util.Call(_visa_probe_resource, res, open_timeout, timeout, 'ascii')
         for res in visa_list_resources()
@@ -1669,6 +2059,7 @@ def visa_probe_devices(
     }
 
     devices = util.concurrently(**calls, catch=False, flatten=False)
+    _visa_probe_cache_update({res: devices.get(res, None) for res in calls})
 
     if len(devices) == 0:
         return []
@@ -1684,12 +2075,37 @@ def visa_probe_devices(
         devices = {
             resource: device
             for resource, device in devices.items()
-            if match_target(device)
+            if _visa_match_identity(target, device.make, device.model, device.serial)
         }
 
     return list(devices.values())
 
 
+def _visa_match_identity(
+    target: VISADevice | None, make: str, model: str, serial: str
+) -> bool:
+    """returns True if the identity matches the make, model, and serial number of target"""
+    if target is None:
+        return True
+
+    if target.make is not None:
+        # apply the make filter
+        if make.lower() != target.make.lower():
+            return False
+
+    if target.model is not None:
+        # apply the model filter
+        if not target.model.lower().startswith(model.lower()):
+            return False
+
+    if target.resource is not None and not _visa_valid_resource_name(target.resource):
+        # treat the resource string as a serial number, and filter
+        if target.resource.lower() != serial.lower():
+            return False
+
+    return True
+
+
 class Win32ComDevice(Device):
     """Basic support for calling win32 COM APIs.
 
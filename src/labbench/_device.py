@@ -14,7 +14,9 @@ from . import paramattr as attr
 from . import util
 from .paramattr._bases import (
     HasParamAttrs,
+    OwnerAccessAttr,
     Undefined,
+    get_key_adapter,
     hold_attr_notifications,
 )
 
@@ -140,6 +142,17 @@ def attr_def_to_parameter(attr_def: attr.ParamAttr) -> inspect.Parameter:
     )
 
 
+def _is_batchable(attr_def: attr.ParamAttr) -> bool:
+    """returns True if attr_def uses the standard get and set implementation"""
+    if isinstance(attr_def, attr.value.Value):
+        return type(attr_def).set_in_owner is attr.value.Value.set_in_owner
+    else:
+        return (
+            type(attr_def).get_from_owner is OwnerAccessAttr.get_from_owner
+            and type(attr_def).set_in_owner is OwnerAccessAttr.set_in_owner
+        )
+
+
 @typing.dataclass_transform(
     kw_only_default=True,
     eq_default=False,
@@ -186,6 +199,116 @@ class DeviceDataClass(HasParamAttrs, util.Ownable):
         self.open = self.__open_wrapper__
         self.close = self.__close_wrapper__
 
+    @util.hide_in_traceback
+    def get_many(self, names: typing.Iterable[str], /) -> dict[str, typing.Any]:
+        """get multiple value and property attributes in one batch.
+
+        Properties implemented with `key` are requested from the key adapter together,
+        which may combine them into fewer operations with the device.
+
+        Arguments:
+            names: the names of the attributes to get
+
+        Returns:
+            a dictionary of the attribute values, keyed on name
+        """
+        names = list(names)
+        cache = self._attr_store.cache
+        ret = {}
+        keyed = {}
+
+        for name, attr_def in self._batch_attr_defs(names).items():
+            if (
+                isinstance(attr_def, OwnerAccessAttr)
+                and _is_batchable(attr_def)
+                and attr_def.gets
+                and attr_def._getter is None
+                and not (attr_def.cache and name in cache)
+            ):
+                keyed[name] = attr_def
+                ret[name] = Undefined
+            else:
+                ret[name] = getattr(self, name)
+
+        if len(keyed) > 0:
+            requests = [(attr_def.key, attr_def, {}) for attr_def in keyed.values()]
+            values = get_key_adapter(self).get_many(self, requests)
+
+            for (name, attr_def), value in zip(keyed.items(), values):
+                ret[name] = attr_def._finalize_get_value(self, value)
+
+            for name, attr_def in keyed.items():
+                self.__notify__(name, ret[name], 'get', cache=attr_def.cache)
+
+        return ret
+
+    @util.hide_in_traceback
+    def set_many(self, values: dict[str, typing.Any], /):
+        """set multiple value and property attributes in one batch.
+
+        Each value is validated before any are applied. Properties implemented with
+        `key` are passed to the key adapter together, which may combine them into
+        fewer operations with the device. Notifications to observers are held until
+        all of the values have been applied.
+
+        Arguments:
+            values: the new attribute values, keyed on name
+        """
+        attr_defs = self._batch_attr_defs(values.keys())
+
+        # validate everything before making any changes
+        prepared = {
+            name: attr_def._prepare_set_value(self, values[name])
+            for name, attr_def in attr_defs.items()
+        }
+
+        keyed = []
+        with hold_attr_notifications(self):
+            for name, value in prepared.items():
+                attr_def = attr_defs[name]
+                if not _is_batchable(attr_def):
+                    continue
+                elif isinstance(attr_def, attr.value.Value):
+                    # the cache is updated by the notification
+                    pass
+                elif attr_def._setter is not None:
+                    attr_def._setter(self, value)
+                else:
+                    keyed.append((attr_def.key, value, attr_def, {}))
+
+            if len(keyed) > 0:
+                get_key_adapter(self).set_many(self, keyed)
+
+        for name, value in prepared.items():
+            attr_def = attr_defs[name]
+            if _is_batchable(attr_def):
+                self.__notify__(name, value, 'set', cache=attr_def.cache)
+            else:
+                # dependent attributes implement their own notification
+                attr_def.set_in_owner(self, values[name])
+
+        for name, attr_def in attr_defs.items():
+            if getattr(attr_def, 'get_on_set', False):
+                getattr(self, name)
+
+    def _batch_attr_defs(
+        self, names: typing.Iterable[str]
+    ) -> dict[str, attr.ParamAttr]:
+        all_attrs = attr.get_class_attrs(self)
+
+        attr_defs = {}
+        for name in names:
+            attr_def = all_attrs.get(name, None)
+            if attr_def is None:
+                raise AttributeError(f'{self!r} has no paramattr {name!r}')
+            elif isinstance(attr_def, attr.method.Method):
+                raise TypeError(
+                    f'{name!r} is a method paramattr, which does not support batch access'
+                )
+            attr_defs[name] = attr_def
+
+        return attr_defs
+
     @classmethod
     @util.hide_in_traceback
     def __init_subclass__(cls):
@@ -410,5 +410,48 @@ def visa_probe(resource_manager, stubs):
             summarize_device_probe(device)
 
 
+@cli.command(
+    name='visa-probe-cache',
+    help="""Refresh or clear the cache of VISA probe results.
+
+    ACTION is 'refresh' to probe all available resources and save the results, or
+    'clear' to remove the saved results. The pyvisa resource manager will be
+    RESOURCE_MANAGER. This should be one of @ivi, @sim-labbench, or @py. If unspecified,
+    the default is @py. The 'clear' action applies to all resource managers unless
+    RESOURCE_MANAGER is given.
+    """,
+)
+@click.argument('action', type=click.Choice(['refresh', 'clear']))
+@click.argument(
+    'resource_manager',
+    default=None,
+    required=False,
+    type=str,
+)
+def visa_probe_cache(action, resource_manager):
+    import labbench as lb
+
+    lb.util.force_full_traceback(False)
+
+    path = lb.visa_probe_cache_path()
+    if path is None:
+        print('the VISA probe cache is disabled', file=sys.stderr)
+        return
+
+    if action == 'clear':
+        if resource_manager is not None:
+            lb.visa_default_resource_manager(resource_manager)
+            resource_manager = str(lb.VISADevice._rm)
+        lb.visa_clear_probe_cache(resource_manager)
+        print(f'cleared VISA probe cache at "{path}"')
+    else:
+        lb.visa_default_resource_manager(resource_manager)
+        devices = lb.visa_probe_devices()
+        print(
+            f'saved {len(devices)} device(s) discovered on resource manager '
+            f'{lb.VISADevice._rm!r} to "{path}"'
+        )
+
+
 if __name__ == '__main__':
     do_cli()
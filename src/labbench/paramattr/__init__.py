@@ -3,6 +3,7 @@ from ._bases import (
     HasParamAttrs,
     KeyAdapterBase,
     ParamAttr,
+    ParamAttrEvent,
     Undefined,
     adjust,
     get_class_attrs,
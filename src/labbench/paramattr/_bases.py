@@ -13,7 +13,7 @@ import numbers
 from contextlib import contextmanager
 from copy import copy
 from typing import Any, Union
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 import types
 
 # for common types
@@ -317,6 +317,31 @@ class KeyAdapterBase:
             f'key adapter does not implement "set" {type(self)!r}'
         )
 
+    def get_many(
+        self,
+        owner: HasParamAttrs,
+        requests: list[tuple[str, ParamAttr, dict[str, Any]]],
+    ) -> list:
+        """returns a list of values for a batch of (key, attr, kwargs) requests.
+
+        By default, this calls `get` for each request. Subclasses may override it to
+        combine the requests into fewer operations.
+        """
+        return [self.get(owner, key, attr, kwargs) for key, attr, kwargs in requests]
+
+    def set_many(
+        self,
+        owner: HasParamAttrs,
+        requests: list[tuple[str, Any, ParamAttr, dict[str, Any]]],
+    ):
+        """applies a batch of (key, value, attr, kwargs) requests.
+
+        By default, this calls `set` for each request. Subclasses may override it to
+        combine the requests into fewer operations.
+        """
+        for key, value, attr, kwargs in requests:
+            self.set(owner, key, value, attr, kwargs)
+
     def get_kwarg_names(self, key: Any) -> list[str]:
         """returns a list of arguments for the parameter attribute key.
 
@@ -951,6 +976,10 @@ class Value(ParamAttr[T]):
         elif self.default is None and not self.allow_none:
             raise TypeError('cannot set default=None with allow_none=True')
 
+        # specialized in __init_owner_subclass__
+        self._get_value = self.get_from_owner
+        self._set_value = self.set_in_owner
+
     @typing.overload
     def __get__(self, owner: HasParamAttrs, owner_cls: type[HasParamAttrs]) -> T: ...
 
@@ -980,20 +1009,92 @@ class Value(ParamAttr[T]):
             # escape an infinite recursion loop before accessing any class members
             return self  # type: ignore
 
+        if owner_cls is self.__objclass__:
+            # the usual case: owner classes hold their own copies of each paramattr
+            return self._get_value(owner)
+
         cls_getter = owner_cls.__dict__.get(self.name, None)  # type: ignore
         objclass_getter = self.__objclass__.__dict__.get(self.name)  # type: ignore
         if cls_getter is not objclass_getter:
             return self  # type: ignore
         else:
-            return self.get_from_owner(owner)
+            return self._get_value(owner)
 
     @util.hide_in_traceback
     def __set__(self, owner: HasParamAttrs, value: T):
         if isinstance(owner, HasParamAttrs):
-            return self.set_in_owner(owner, value)
+            return self._set_value(owner, value)
         else:
             return self
 
+    def __init_owner_subclass__(self, owner_cls: type[HasParamAttrs]):
+        super().__init_owner_subclass__(owner_cls)
+        self._get_value, self._set_value = self._compile_accessors(owner_cls)
+
+    def _compile_accessors(
+        self, owner_cls: type[HasParamAttrs]
+    ) -> tuple[typing.Callable, typing.Callable]:
+        """returns (getter, setter) functions specialized for access to this value in `owner_cls`.
+
+        The common case of builtin scalar types, with default get, set,
+        and conversion methods, reduces to a type cast, any bounds checks,
+        and a cache update. Notification is skipped unless handlers are
+        registered in the owner. Everything else falls back to the
+        general `get_from_owner` and `set_in_owner` implementations.
+        """
+
+        cls = type(self)
+        if (
+            cls.get_from_owner is not Value.get_from_owner
+            or cls.set_in_owner is not Value.set_in_owner
+            or cls.to_pythonic is not ParamAttr.to_pythonic
+            or cls.from_pythonic is not ParamAttr.from_pythonic
+            or self._type not in _FAST_ACCESS_TYPES
+        ):
+            return self.get_from_owner, self.set_in_owner
+
+        attr_def = self
+        name = self.name
+        cast = self._type
+        get_from_owner = self.get_from_owner
+        set_in_owner = self.set_in_owner
+        always_notify = owner_cls.__notify__ is not HasParamAttrs.__notify__
+
+        # the type cast already guarantees the type checks in the
+        # default validators, so only bounds checks remain for numbers
+        check_bounds = validate = None
+        if cls.validate is BoundedNumber.validate:
+            check_bounds = self.check_bounds
+        elif cls.validate is not ParamAttr.validate:
+            validate = self.validate
+
+        @util.hide_in_traceback
+        def get_value(owner: HasParamAttrs) -> T:
+            if attr_def.gets:
+                try:
+                    return owner._attr_store.cache[name]
+                except KeyError:
+                    pass
+            return get_from_owner(owner)
+
+        @util.hide_in_traceback
+        def set_value(owner: HasParamAttrs, value: T):
+            if value is None or attr_def.only or not attr_def.sets:
+                return set_in_owner(owner, value)
+
+            value = cast(value)
+            if check_bounds is not None:
+                check_bounds(value, owner)
+            elif validate is not None:
+                value = validate(value, owner)
+
+            store = owner._attr_store
+            store.cache[name] = value
+            if always_notify or store.handlers:
+                owner.__notify__(name, value, 'set', cache=attr_def.cache)
+
+        return get_value, set_value
+
     def get_from_owner(self, owner: HasParamAttrs, kwargs: dict[str, Any] = {}) -> T:
         if not self.gets:
             # stop now if this is not a gets ParamAttr
@@ -1020,6 +1121,17 @@ class Value(ParamAttr[T]):
             self.sets = sets
 
 
+# builtin types that need no validation beyond the cast in to_pythonic
+_FAST_ACCESS_TYPES = (
+    builtins.bool,
+    builtins.int,
+    builtins.float,
+    builtins.complex,
+    builtins.str,
+    builtins.bytes,
+)
+
+
 class MethodKeywordArgument(ParamAttr[T], typing.Generic[T, T_co, _P]):
     name: str = field(Undefined, kw_only=False)  # type: ignore
     default: T | None | Undefined = Undefined  # type: ignore
@@ -1561,23 +1673,85 @@ def hold_attr_notifications(owner: HasParamAttrs):
         owner._attr_store.cache[name] = value
 
     original, owner.__notify__ = owner.__notify__, skip_notify
-    yield
-    owner.__notify__ = original
+    try:
+        yield
+    finally:
+        owner.__notify__ = original
+
+
+class ParamAttrEvent(Mapping):
+    """a read-only notification message for handlers registered with `observe`.
+
+    A single event is shared among all handlers of a notification. For
+    compatibility with dictionary messages, the fields can be accessed
+    as keys (`event['new']`) or attributes (`event.new`).
+    """
+
+    __slots__ = 'new', 'old', 'owner', 'name', 'paramattr', 'type', 'cache', 'kwargs'
+
+    def __init__(self, new, old, owner, name, paramattr, type, cache, kwargs):
+        self.new = new
+        self.old = old
+        self.owner = owner
+        self.name = name
+        self.paramattr = paramattr
+        self.type = type
+        self.cache = cache
+        self.kwargs = kwargs
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({dict(self)!r})'
 
 
 class HasParamAttrsInstInfo:
-    handlers: dict[str, typing.Callable]
+    handlers: dict[typing.Callable, tuple[None | frozenset[str], frozenset[str]]]
     calibrations: dict[None | str, Any]
     cache: dict[None | str, Any]
     methods: dict[str, _MethodDescriptor]
 
-    __slots__ = 'handlers', 'calibrations', 'cache', 'methods'
+    # handlers to call for each (name, type) event, and (None, type) for other names
+    handler_index: dict[tuple[None | str, str], tuple[typing.Callable, ...]]
+
+    __slots__ = 'handlers', 'calibrations', 'cache', 'methods', 'handler_index'
 
     def __init__(self, owner: HasParamAttrs):
         self.handlers = {}
         self.cache = {}
         self.calibrations = {}
         self.methods = {}
+        self.handler_index = {}
+
+    def update_handler_index(self):
+        """rebuild handler_index to reflect the filters in handlers"""
+        named_keys = set()
+        types = set()
+        for names, types_ in self.handlers.values():
+            types.update(types_)
+            if names is not None:
+                named_keys.update((n, t) for n in names for t in types_)
+
+        keys = named_keys | {(None, t) for t in types}
+
+        # each bucket includes the unfiltered handlers, in order of registration
+        self.handler_index = {
+            (name, type_): tuple(
+                handler
+                for handler, (names, types_) in self.handlers.items()
+                if type_ in types_ and (names is None or name in names)
+            )
+            for name, type_ in keys
+        }
 
 
 def get_key_adapter(obj: HasParamAttrs | type[HasParamAttrs]) -> KeyAdapterBase:
@@ -1645,21 +1819,35 @@ class HasParamAttrs(metaclass=HasParamAttrsMeta):
 
     @util.hide_in_traceback
     def __notify__(self, name, value, type, cache, kwargs={}):
-        msg = dict(
-            new=value,
-            old=self._attr_store.cache.setdefault(name, Undefined),
-            owner=self,
-            name=name,
-            paramattr=get_class_attrs(self)[name],
-            type=type,
-            cache=cache,
-            kwargs=kwargs,
-        )
+        store = self._attr_store
+        index = store.handler_index
+
+        if index:
+            handlers = index.get((name, type))
+            if handlers is None:
+                handlers = index.get((None, type), ())
+        else:
+            handlers = ()
+
+        if handlers:
+            if isinstance(value, ParamAttr):
+                raise TypeError('ParamAttr instance returned as a callback value')
+
+            event = ParamAttrEvent(
+                new=value,
+                old=store.cache.setdefault(name, Undefined),
+                owner=self,
+                name=name,
+                paramattr=get_class_attrs(self)[name],
+                type=type,
+                cache=cache,
+                kwargs=kwargs,
+            )
 
-        for handler in list(self._attr_store.handlers.values()):
-            handler(dict(msg))
+            for handler in handlers:
+                handler(event)
 
-        self._attr_store.cache[name] = value
+        store.cache[name] = value
 
     @util.hide_in_traceback
     def __get_value__(self, name):
@@ -1764,18 +1952,19 @@ THasParamAttrsCls = type[THasParamAttrs]
 def observe(obj, handler, name=Undefined, type_=('get', 'set')):
     """Register a handler function to be called on changes to attributes defined with ParamAttr.
 
-    The handler function takes a single message argument. This
-    dictionary message has the keys
+    The handler function takes a single read-only `ParamAttrEvent` message argument,
+    which is shared with any other handlers. Its keys (or attributes) include
 
     * `new`: the updated value
     * `old`: the previous value
     * `owner`: the object that owns the attribute
     * `name`: the name of the attribute
-    * 'event': 'set' or 'get'
+    * `type`: 'set' or 'get'
 
     Arguments:
         handler: the handler function to call when the value changes
-        names: notify only changes to these attribute names (None to disable filtering)
+        name: notify only changes to these attribute names (Undefined to disable filtering)
+        type_: notify only these types of events
     """
 
     def validate_name(n):
@@ -1790,30 +1979,24 @@ def observe(obj, handler, name=Undefined, type_=('get', 'set')):
 
     if isinstance(name, str):
         validate_name(name)
-        name = (name,)
+        names = frozenset((name,))
     elif isinstance(name, (tuple, list)):
         for n in name:
             validate_name(n)
-    elif name is not Undefined:
+        names = frozenset(name)
+    elif name is Undefined:
+        names = None
+    else:
         raise ValueError(
             f'name argument {name} has invalid type - must be one of (str, tuple, list), or the value Undefined'
         )
 
-    if isinstance(type, str):
+    if isinstance(type_, str):
         type_ = (type_,)
 
-    def wrapped(msg):
-        # filter according to name and type
-        if name is not Undefined and msg['name'] not in name:
-            return
-        elif msg['type'] not in type_:
-            return
-        elif isinstance(msg['new'], ParamAttr):
-            raise TypeError('ParamAttr instance returned as a callback value')
-        handler(msg)
-
     if isinstance(obj, HasParamAttrs):
-        obj._attr_store.handlers[handler] = wrapped
+        obj._attr_store.handlers[handler] = names, frozenset(type_)
+        obj._attr_store.update_handler_index()
     else:
         raise TypeError('object to observe must be an instance of Device')
 
@@ -1827,6 +2010,7 @@ def unobserve(obj, handler):
             ex = e
         else:
             ex = None
+            obj._attr_store.update_handler_index()
         if ex:
             raise KeyError(f'{handler} was not registered to observe {obj}')
     else:
@@ -2284,7 +2468,10 @@ class TransformedNumberMixIn(DependentNumberParamAttr):
 
     def __init_owner_instance__(self, owner):
         super().__init_owner_instance__(owner)
-        observe(owner, self.__owner_event__)
+        base_attr = self._paramattr_dependencies['base']
+        base_name = getattr(base_attr, 'name', None)
+        if base_name is not None and hasattr(base_attr, '__objclass__'):
+            observe(owner, self.__owner_event__, name=base_name)
 
     def __owner_event__(self, msg):
         # pass on a corresponding notification when the base changes
@@ -2395,7 +2582,10 @@ class BoundedNumber(ParamAttr[T]):
 
     @util.hide_in_traceback
     def validate(self, value, owner=None):
-        if not isinstance(value, (bytes, str, bool, numbers.Number)):
+        # check builtins first to skip the slower numbers.Number ABC check
+        if not isinstance(
+            value, (builtins.float, builtins.int, bytes, str, numbers.Number)
+        ):
             raise ValueError(
                 f"a '{type(self).__qualname__}' attribute supports only numerical, str, or bytes types"
             )
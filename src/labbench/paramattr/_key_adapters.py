@@ -1,10 +1,33 @@
 import builtins
+import re
 import string
 from typing import Any, Union
 from numbers import Number
 
 from ._bases import HasParamAttrs, KeyAdapterBase, ParamAttr, T, BoundedNumber
-from ._types import Bool
+from ._types import Bool, NDArray
+
+
+def _group_messages(
+    messages: list[str], separator: str | None, max_length: int | None
+) -> list[list[str]]:
+    if separator is None:
+        return [[msg] for msg in messages]
+    elif max_length is None:
+        return [messages] if len(messages) > 0 else []
+
+    groups = []
+    length = 0
+    for msg in messages:
+        extended_length = length + len(separator) + len(msg)
+        if len(groups) > 0 and extended_length <= max_length:
+            groups[-1].append(msg)
+            length = extended_length
+        else:
+            groups.append([msg])
+            length = len(msg)
+
+    return groups
 
 
 class message_keying(KeyAdapterBase):
@@ -43,6 +66,10 @@ class message_keying(KeyAdapterBase):
             class CustomDevice(lb.VISADevice):
                 pass
 
+    When `separator` is set, `get_many` and `set_many` join multiple messages into
+    compound messages that are each no longer than `max_message_length`. Subclasses
+    that override `get` or `set` instead make one call for each message.
+
     See Also:
 
         * :meth:`labbench.paramattr.visa_keying`
@@ -58,6 +85,9 @@ class message_keying(KeyAdapterBase):
         write_func=None,
         query_func=None,
         remap={},
+        separator=None,
+        max_message_length=None,
+        binary_query_func=None,
     ):
         super().__init__()
 
@@ -65,6 +95,9 @@ class message_keying(KeyAdapterBase):
         self.write_fmt = write_fmt
         self.write_func = write_func
         self.query_func = query_func
+        self.binary_query_func = binary_query_func
+        self.separator = separator
+        self.max_message_length = max_message_length
 
         if len(remap) == 0:
             self.value_map = {}
@@ -140,21 +173,16 @@ class message_keying(KeyAdapterBase):
         Returns:
             response (str)
         """
-        if self.query_fmt is None:
-            raise ValueError('query_fmt needs to be set for key get operations')
-        if self.query_func is None:
-            raise ValueError('query_func needs to be set for key get operations')
-        query_func = getattr(owner, self.query_func)
-        try:
-            expanded_scpi_key = key.format(**kwargs)
-        except KeyError:
-            expected_kws = set(self.get_kwarg_names(key))
-            missing_kws = expected_kws - set(kwargs.keys())
-            raise TypeError(
-                f'{attr._owned_name(owner)}() missing required positional argument(s) {str(missing_kws)[1:-1]}'
+        if isinstance(attr, NDArray) and attr.binary:
+            query_func = self._get_owner_func(owner, 'binary_query')
+            return query_func(
+                self.format_query(owner, key, attr, kwargs),
+                dtype=attr.dtype,
+                is_big_endian=attr.big_endian,
             )
 
-        value_msg = query_func(self.query_fmt.format(key=expanded_scpi_key)).rstrip()
+        query_func = self._get_owner_func(owner, 'query')
+        value_msg = query_func(self.format_query(owner, key, attr, kwargs)).rstrip()
         return self.from_message(value_msg)
 
     def set(
@@ -177,15 +205,118 @@ class message_keying(KeyAdapterBase):
             value (str): value to assign
             name (str, None): name of the trait setting the key (or None to indicate no trait) (ignored)
         """
+        write_func = self._get_owner_func(owner, 'write')
+        write_func(self.format_write(key, value, attr, kwargs))
+
+    def get_many(
+        self,
+        owner: HasParamAttrs,
+        requests: list[tuple[str, ParamAttr, dict[str, Any]]],
+    ) -> list:
+        """queries a batch of (key, attr, kwargs) parameters in compound messages.
+
+        Returns:
+            list of responses, in the same order as `requests`
+        """
+        if (
+            self.separator is None
+            or type(self).get is not message_keying.get
+            or any(isinstance(attr, NDArray) for _, attr, _ in requests)
+        ):
+            return super().get_many(owner, requests)
+
+        query_func = self._get_owner_func(owner, 'query')
+        queries = [
+            self.format_query(owner, key, attr, kwargs)
+            for key, attr, kwargs in requests
+        ]
+
+        ret = []
+        for group in self.group_messages(queries):
+            reply = query_func(self.separator.join(group)).rstrip()
+            values = self.split_reply(reply)
+            if len(values) != len(group):
+                raise ValueError(
+                    f'expected {len(group)} values in reply to compound query, '
+                    f'but received {len(values)}'
+                )
+            ret.extend(self.from_message(v.strip()) for v in values)
+
+        return ret
+
+    def set_many(
+        self,
+        owner: HasParamAttrs,
+        requests: list[tuple[str, Any, ParamAttr, dict[str, Any]]],
+    ):
+        """writes a batch of (key, value, attr, kwargs) parameters in compound messages."""
+        if self.separator is None or type(self).set is not message_keying.set:
+            return super().set_many(owner, requests)
+
+        write_func = self._get_owner_func(owner, 'write')
+        messages = [
+            self.format_write(key, value, attr, kwargs)
+            for key, value, attr, kwargs in requests
+        ]
+
+        for group in self.group_messages(messages):
+            write_func(self.separator.join(group))
+
+    def format_query(
+        self,
+        owner: HasParamAttrs,
+        key: str,
+        attr: ParamAttr | None = None,
+        kwargs: dict[str, Any] = {},
+    ) -> str:
+        """returns the message string to query the parameter `key`"""
+        if self.query_fmt is None:
+            raise ValueError('query_fmt needs to be set for key get operations')
+
+        try:
+            expanded_scpi_key = key.format(**kwargs)
+        except KeyError:
+            expected_kws = set(self.get_kwarg_names(key))
+            missing_kws = expected_kws - set(kwargs.keys())
+            raise TypeError(
+                f'{attr._owned_name(owner)}() missing required positional argument(s) {str(missing_kws)[1:-1]}'
+            )
+
+        return self.query_fmt.format(key=expanded_scpi_key)
+
+    def format_write(
+        self,
+        key: str,
+        value: Any,
+        attr: ParamAttr | None = None,
+        kwargs: dict[str, Any] = {},
+    ) -> str:
+        """returns the message string to set the parameter `key` to `value`"""
         if self.write_fmt is None:
             raise ValueError('write_fmt needs to be set for key set operations')
-        if self.write_func is None:
-            raise ValueError('write_func needs to be set for key set operations')
 
         value_msg = self.to_message(value, attr)
         expanded_scpi_key = key.format(**kwargs)
-        write_func = getattr(owner, self.write_func)
-        write_func(self.write_fmt.format(key=expanded_scpi_key, value=value_msg))
+        return self.write_fmt.format(key=expanded_scpi_key, value=value_msg)
+
+    def group_messages(self, messages: list[str]) -> list[list[str]]:
+        """split a list of messages into groups that each fit in one compound message.
+
+        Each group has at least one message, even if it exceeds `max_message_length`.
+        """
+        return _group_messages(messages, self.separator, self.max_message_length)
+
+    def split_reply(self, reply: str) -> list[str]:
+        """split the reply to a compound query at separators outside of quotes"""
+        sep = re.escape(self.separator)
+        return re.split(sep + r'(?=(?:[^"]*"[^"]*")*[^"]*$)', reply)
+
+    def _get_owner_func(self, owner: HasParamAttrs, op: str):
+        func_name = getattr(self, f'{op}_func')
+        if func_name is None:
+            op_name = 'set' if op == 'write' else 'get'
+            raise ValueError(f'{op}_func needs to be set for key {op_name} operations')
+        return getattr(owner, func_name)
 
 
 class visa_keying(message_keying):
@@ -203,6 +334,10 @@ class visa_keying(message_keying):
             class MyDevice(lb.VISADevice):
                 pass
 
+    Messages from `Device.get_many`, `Device.set_many`, and `VISADevice.batch`
+    are joined with `separator` into compound messages of up to
+    `max_message_length` characters. Set `separator=None` for instruments
+    that do not support compound messages.
     """
 
     def __init__(
@@ -211,6 +346,8 @@ class visa_keying(message_keying):
         query_fmt='{key}?',
         write_fmt='{key} {value}',
         remap={},
+        separator=';',
+        max_message_length=1024,
     ):
         super().__init__(
             query_fmt=query_fmt,
@@ -218,4 +355,7 @@ class visa_keying(message_keying):
             remap=remap,
             write_func='write',
             query_func='query',
+            binary_query_func='query_binary_values',
+            separator=separator,
+            max_message_length=max_message_length,
         )
@@ -1,13 +1,16 @@
 from .. import util
 from . import _bases
 
+import builtins
 import numbers
 import typing
 from pathlib import Path as _Path
 
 if typing.TYPE_CHECKING:
+    import numpy as np
     import validators as _val
 else:
+    np = util.lazy_import('numpy')
     _val = util.lazy_import('validators')
 
 
@@ -141,6 +144,50 @@ class Tuple(Iterable[tuple], type=tuple):
     sets: bool = False
 
 
+class NDArray(_bases.ParamAttr):
+    """accepts numpy arrays, or comma-separated numerical str or bytes.
+
+    When implemented with `key` in a `labbench.VISADevice`, the trace is transferred as
+    an IEEE 488.2 binary block if `binary` is True, or as an ASCII message otherwise.
+    """
+
+    dtype: str = 'float32'
+    """ numpy data type of the array elements """
+
+    binary: bool = True
+    """ whether to transfer as an IEEE 488.2 binary block (instead of ASCII) """
+
+    big_endian: bool = False
+    """ byte order of the elements in binary transfers """
+
+    sets: bool = False
+
+    @util.hide_in_traceback
+    def to_pythonic(self, value):
+        if isinstance(value, builtins.bytes):
+            value = value.decode()
+        if isinstance(value, builtins.str):
+            return np.fromstring(value, dtype=self.dtype, sep=',')
+        return np.asarray(value)
+
+    @util.hide_in_traceback
+    def validate(self, value, owner=None):
+        if not isinstance(value, np.ndarray):
+            raise ValueError(
+                f"'{type(self).__qualname__}' attributes accept only numpy arrays"
+            )
+        return value
+
+    def doc_params(
+        self, skip: list[str] = ['help', 'label'], as_argument: bool = False
+    ) -> str:
+        if as_argument:
+            return None
+        else:
+            transfer = 'binary block' if self.binary else 'ASCII'
+            return f'* Data type: {self.dtype} ({transfer} transfer)'
+
+
 class Path(_bases.ParamAttr[_Path], type=_Path):
     must_exist: bool = False
     """ does the path need to exist when set? """
@@ -48,3 +48,7 @@ class Path(Property, _types.Path):
 
 class NetworkAddress(Property, _types.NetworkAddress):
     pass
+
+
+class ndarray(Property, _types.NDArray):
+    pass
@@ -97,6 +97,9 @@ class SpectrumAnalyzer(VISADevice):
         help='resolution bandwidth',
         label='Hz',
     )
+    trace = attr.property.ndarray(
+        key='TRAC:DATA', help='trace data as a binary block', label='dBm'
+    )
 
     def load_state(self, remote_filename: str):
         """revert to instrument preset state"""
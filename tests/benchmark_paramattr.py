@@ -0,0 +1,60 @@
+"""micro-benchmark for access to value paramattrs.
+
+Run this as a script: `python benchmark_paramattr.py`
+"""
+
+import timeit
+
+import labbench as lb
+from labbench import paramattr as attr
+
+
+class BenchmarkDevice(lb.Device):
+    bool_value: bool = attr.value.bool(True)
+    int_value: int = attr.value.int(1)
+    float_value: float = attr.value.float(1.0, min=0, max=10)
+    str_value: str = attr.value.str('a')
+    str_only: str = attr.value.str('a', only=('a', 'b'))
+
+
+def generic_accessors(device):
+    """returns functions that access through the general (uncompiled) implementation"""
+    attrs = attr.get_class_attrs(device)
+
+    def get(name):
+        return attrs[name].get_from_owner(device)
+
+    def set(name, value):
+        attrs[name].set_in_owner(device, value)
+
+    return get, set
+
+
+def run(number=100_000, repeat=5):
+    device = BenchmarkDevice()
+    generic_get, generic_set = generic_accessors(device)
+
+    cases = {
+        'bool_value': True,
+        'int_value': 3,
+        'float_value': 2.0,
+        'str_value': 'b',
+        'str_only': 'b',
+    }
+
+    def time_ns(func):
+        return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e9
+
+    print(f'{"":<14}{"get (ns)":>12}{"generic":>12}{"set (ns)":>12}{"generic":>12}')
+    for name, value in cases.items():
+        results = [
+            time_ns(lambda: getattr(device, name)),
+            time_ns(lambda: generic_get(name)),
+            time_ns(lambda: setattr(device, name, value)),
+            time_ns(lambda: generic_set(name, value)),
+        ]
+        print(f'{name:<14}' + ''.join(f'{r:>12.0f}' for r in results))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,61 @@
+"""micro-benchmark for parsing ASCII trace replies from VISA devices.
+
+Run this as a script: `python benchmark_visa.py`
+"""
+
+import timeit
+
+import numpy as np
+
+import labbench as lb
+from labbench._backends import _parse_ascii_values
+from labbench.testing import pyvisa_sim
+
+
+def time_us(func, number, repeat):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def run_sim(number=500, repeat=5):
+    """round trips through the pyvisa-sim 'FETC?' dialogue"""
+    lb.visa_default_resource_manager('@sim-labbench')
+    specan = pyvisa_sim.SpectrumAnalyzer()
+
+    with specan:
+        out = specan.query_ascii_values('FETC?')
+        cases = {
+            'pyvisa (list)': lambda: specan.backend.query_ascii_values('FETC?'),
+            'labbench (list)': lambda: specan.query_ascii_values(
+                'FETC?', container=list
+            ),
+            'labbench': lambda: specan.query_ascii_values('FETC?'),
+            'labbench (out)': lambda: specan.query_ascii_values('FETC?', out=out),
+        }
+
+        print(f'FETC? round trip with {out.size} values')
+        for name, func in cases.items():
+            print(f'  {name:<20}{time_us(func, number, repeat):>10.1f} us')
+
+
+def run_parse(size=100_000, number=20, repeat=5):
+    """parsing only, for a reply that is larger than the simulated one"""
+    raw = ','.join(f'{v:0.3f}' for v in np.random.uniform(-60, -50, size)).encode()
+    out = np.empty(size, dtype='float64')
+
+    def python_parse():
+        return [float(s) for s in raw.decode().split(',')]
+
+    cases = {
+        'python (list)': python_parse,
+        'numpy': lambda: _parse_ascii_values(raw, 'float64', ','),
+        'numpy (out)': lambda: _parse_ascii_values(raw, 'float64', ',', out),
+    }
+
+    print(f'parse {size} values ({len(raw) / 1e6:0.1f} MB)')
+    for name, func in cases.items():
+        print(f'  {name:<20}{time_us(func, number, repeat) / 1e3:>10.2f} ms')
+
+
+if __name__ == '__main__':
+    run_sim()
+    run_parse()
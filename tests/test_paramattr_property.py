@@ -115,3 +115,30 @@ def test_cache(opened_device):
 
 def test_all_get_sets(opened_device, role_type):
     loop_closed_loop_set_gets(opened_device, role_type, set_then_get)
+
+
+def test_set_many(opened_device):
+    opened_device.backend.clear_counts()
+    opened_device.set_many({'bool_keyed': False, 'int_keyed_unbounded': '7'})
+
+    assert opened_device.backend.values['bool_keyed'] is False
+    assert opened_device.backend.values['int_keyed_unbounded'] == 7
+    assert [n['name'] for n in opened_device.backend.notifications] == [
+        'bool_keyed',
+        'int_keyed_unbounded',
+    ]
+
+    # nothing is applied if any value is invalid
+    opened_device.backend.clear_counts()
+    with pytest.raises(ValueError):
+        opened_device.set_many(
+            {'int_keyed_unbounded': 8, 'int_decorated_low_bound_setonly': 0}
+        )
+    assert opened_device.backend.values['int_keyed_unbounded'] == 7
+    assert len(opened_device.backend.notifications) == 0
+
+
+def test_get_many(opened_device):
+    opened_device.set_many({'bool_keyed': True, 'int_keyed_unbounded': 3, 'any': 5})
+    values = opened_device.get_many(['int_keyed_unbounded', 'any', 'bool_keyed'])
+    assert values == {'int_keyed_unbounded': 3, 'any': 5, 'bool_keyed': True}
@@ -478,3 +478,68 @@ def test_requried_parameter_instantiation():
         RequiredParametersTestDevice()
 
     RequiredParametersTestDevice(required_str='hi', required_str_allow_none=None)
+
+
+def test_set_without_observers():
+    device = StoreTestDevice()
+
+    # no handlers are registered before open()
+    device.int_with_default = '3'
+    assert device.int_with_default == 3
+    with pytest.raises(ValueError):
+        device.float_low_bounded = 0
+
+    notifications = []
+    attr.observe(device, notifications.append, name='int_with_default')
+    device.int_with_default = 4
+    attr.unobserve(device, notifications.append)
+    device.int_with_default = 5
+
+    assert device.int_with_default == 5
+    assert [n['new'] for n in notifications] == [4]
+
+
+def test_observe_filters():
+    device = StoreTestDevice()
+
+    int_events = []
+    all_events = []
+    attr.observe(device, int_events.append, name='int_with_default', type_='set')
+    attr.observe(device, all_events.append)
+
+    device.int_with_default = 4
+    device.str = 'moose'
+    device.int_with_default
+
+    assert [e['name'] for e in int_events] == ['int_with_default']
+    assert [e['name'] for e in all_events] == ['int_with_default', 'str']
+
+    # handlers share the same read-only event
+    assert int_events[0] is all_events[0]
+    assert int_events[0].new == int_events[0]['new'] == 4
+    with pytest.raises(TypeError):
+        int_events[0]['new'] = 5
+
+
+def test_observe_order():
+    device = StoreTestDevice()
+    calls = []
+
+    def named(msg):
+        calls.append('named')
+
+    def unfiltered(msg):
+        calls.append('unfiltered')
+
+    attr.observe(device, unfiltered)
+    attr.observe(device, named, name='str')
+
+    device.str = 'moose'
+    device.int_with_default = 4
+    assert calls == ['unfiltered', 'named', 'unfiltered']
+
+    calls.clear()
+    attr.unobserve(device, unfiltered)
+    device.str = 'moose'
+    device.int_with_default = 4
+    assert calls == ['named']
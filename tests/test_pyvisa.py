@@ -1,3 +1,5 @@
+import json
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -9,9 +11,13 @@ from labbench.testing import pyvisa_sim
 SPECAN_TRACE = pd.Series("-52.617,-52.373,-52.724,-51.893,-52.27,-52.047,-53.059,-52.053,-52.426,-52.343,-52.228,-52.976,-52.186,-53.0,-51.894,-53.18,-51.96,-52.326,-52.492,-52.871,-52.41,-53.111,-53.199,-52.907,-52.791,-52.68,-51.63,-51.679,-21.743,-52.613,-52.108,-53.138,-52.014,-52.289,-52.235,-52.26,-53.135,-52.503,-52.201,-51.633,-51.933,-52.82,-52.287,-52.594,-51.89,-52.371,-52.068,-51.888,-53.145,-53.085,-52.392,-52.064,-51.688,-52.188,-52.211,-52.226,-52.841,-51.951,-51.573,-51.521,-52.115,-52.302,-52.958,-52.503,-52.32,-52.81,-52.357,-51.729,-52.956,-52.849,-51.883,-51.505,-52.027,-52.234,-52.092,-51.446,-52.798,-51.601,-52.14,-51.477,-52.614,-52.291,-52.532,-52.861,-51.814,-51.821,-52.997,-53.184,-51.761,-53.052,-51.612,-52.876,-52.013,-52.252,-52.059,-52.806,-52.474,-51.689,-52.606,-51.924,-51.964,-51.601,-52.815,-53.172,-52.183,-53.071,-52.763,-52.999,-52.595,-52.463,-52.48,-52.701,-52.337,-51.778,-52.039,-51.493,-51.591,-51.654,-51.525,-52.925,-51.531,-53.169,-52.997,-52.519,-52.298,-52.078,-52.547,-51.518,-51.589,-51.567,-51.502,-51.984,-52.215,-52.681,-51.468,-53.197,-53.007,-51.929,-52.465,-53.132,-52.073,-51.75,-52.8,-52.054,-52.493,-51.605,-53.026,-52.28,-52.331,-52.109,-51.889,-52.878,-51.874,-51.801,-52.031,-52.625,-51.84,-53.029,-52.431,-51.655,-52.51,-52.431,-52.165,-52.009,-51.973,-53.042,-52.632,-51.754,-52.637,-51.757,-51.9,-52.775,-52.49,-52.022,-52.151,-52.05,-51.867,-52.494,-53.014,-52.14,-53.036,-51.799,-51.848,-51.996,-52.254,-52.75,-51.492,-51.755,-52.494,-53.193,-53.114,-53.028,-52.898,-52.992,-53.127,-51.752,-53.065,-52.585,-51.861,-51.596".split(',')).astype('float32').values
 
 @pytest.fixture(autouse=True, scope='module')
-def setup_labbench():
+def setup_labbench(tmp_path_factory):
     lb.visa_default_resource_manager('@sim-labbench')
     lb.util.force_full_traceback(True)
+    prev_cache_path = lb.visa_probe_cache_path()
+    lb.visa_probe_cache_path(tmp_path_factory.mktemp('visa') / 'visa_probe.json')
+    yield
+    lb.visa_probe_cache_path(prev_cache_path)
 
 def test_adjust():
     scope = pyvisa_sim.Oscilloscope()
@@ -86,3 +92,149 @@ def test_method_access():
     with inst:
         inst.resolution_bandwidth(10e3, channel=2)
         inst.resolution_bandwidth(channel=1)
+
+
+def test_batch(monkeypatch):
+    sensor = pyvisa_sim.PowerSensor()
+
+    with sensor:
+        messages = []
+        monkeypatch.setattr(sensor.backend, 'write', messages.append)
+
+        with sensor.batch():
+            sensor.trigger_count = 50
+            sensor.initiate_continuous = True
+            sensor.trigger()
+            assert messages == []
+
+        assert messages == ['TRIG:COUN 50;INIT:CONT ON;TRIG']
+
+        messages.clear()
+        sensor.set_many({'trigger_count': 3, 'measurement_rate': 'FAST'})
+        assert messages == ['TRIG:COUN 3;SENS:MRAT FAST']
+
+
+def test_batch_max_length(monkeypatch):
+    sensor = pyvisa_sim.PowerSensor()
+
+    with sensor:
+        key_adapter = lb.paramattr._bases.get_key_adapter(sensor)
+        monkeypatch.setattr(key_adapter, 'max_message_length', 20)
+        messages = []
+        monkeypatch.setattr(sensor.backend, 'write', messages.append)
+
+        sensor.set_many({'trigger_count': 3, 'measurement_rate': 'FAST'})
+        assert messages == ['TRIG:COUN 3', 'SENS:MRAT FAST']
+
+
+def test_compound_query(monkeypatch):
+    sensor = pyvisa_sim.PowerSensor()
+
+    with sensor:
+        queries = []
+
+        def query(msg):
+            queries.append(msg)
+            return '50;ON;FAST\n'
+
+        monkeypatch.setattr(sensor.backend, 'query', query)
+        values = sensor.get_many(
+            ['trigger_count', 'initiate_continuous', 'measurement_rate']
+        )
+
+        assert queries == ['TRIG:COUN?;INIT:CONT?;SENS:MRAT?']
+        assert values == {
+            'trigger_count': 50,
+            'initiate_continuous': True,
+            'measurement_rate': 'FAST',
+        }
+
+    # separators inside quoted strings are not split
+    key_adapter = lb.paramattr.visa_keying()
+    assert key_adapter.split_reply('1;"A;B";2') == ['1', '"A;B"', '2']
+
+
+def test_binary_block():
+    specan = pyvisa_sim.SpectrumAnalyzer()
+    expected = np.frombuffer(b'AAAABBBBCCCCDDDD', dtype='<f4')
+
+    with specan:
+        values = specan.query_binary_values('TRAC:DATA?')
+        assert values.dtype == np.float32
+        assert np.array_equal(values, expected)
+
+        # fill a preallocated buffer
+        out = np.empty(4, dtype='float32')
+        ret = specan.query_binary_values('TRAC:DATA?', out=out)
+        assert ret is out
+        assert np.array_equal(out, expected)
+
+        big_endian = specan.query_binary_values('TRAC:DATA?', is_big_endian=True)
+        assert np.array_equal(big_endian, expected.byteswap())
+
+        with pytest.raises(ValueError):
+            specan.query_binary_values('TRAC:DATA?', out=np.empty(3))
+
+        # keyed property implementation
+        assert np.array_equal(specan.trace, expected)
+
+def test_query_ascii_values():
+    specan = pyvisa_sim.SpectrumAnalyzer()
+
+    with specan:
+        values = specan.query_ascii_values('FETC?')
+        assert isinstance(values, np.ndarray)
+        assert np.allclose(values, SPECAN_TRACE)
+
+        # reuse a preallocated buffer
+        out = np.empty(len(SPECAN_TRACE), dtype='float32')
+        ret = specan.query_ascii_values('FETC?', out=out)
+        assert ret is out
+        assert np.allclose(out, SPECAN_TRACE)
+
+        with pytest.raises(ValueError):
+            specan.query_ascii_values('FETC?', out=np.empty(3))
+
+        # other containers and the pyvisa fallback
+        values = specan.query_ascii_values('FETC?', container=list)
+        assert isinstance(values, list) and isinstance(values[0], float)
+        assert np.allclose(values, SPECAN_TRACE)
+
+        values = specan.query_ascii_values('FETC?', converter='s')
+        assert isinstance(values, np.ndarray)
+        assert values[0] == '-52.617'
+
+def test_visa_probe_cache(monkeypatch):
+    lb.visa_clear_probe_cache()
+    devices = lb.visa_probe_devices()
+    assert lb.visa_probe_cache_path().exists()
+
+    probe_calls = []
+    full_probe = lb._backends.visa_probe_devices
+
+    def counted_probe(*args, **kws):
+        probe_calls.append(args)
+        return full_probe(*args, **kws)
+
+    monkeypatch.setattr(lb._backends, 'visa_probe_devices', counted_probe)
+
+    # a single identity check of the cached resource
+    sensor = pyvisa_sim.PowerSensor()
+    with sensor:
+        assert sensor.resource in {d.resource for d in devices}
+    assert len(probe_calls) == 0
+
+    # a stale cache entry falls back to the full probe
+    cache = json.loads(lb.visa_probe_cache_path().read_text())
+    entries = cache[str(lb.VISADevice._rm)]
+    entry = entries.pop(sensor.resource)
+    other = next(r for r, e in entries.items() if e['model'] != entry['model'])
+    entries[other] = entry
+    lb.visa_probe_cache_path().write_text(json.dumps(cache))
+
+    with pyvisa_sim.PowerSensor() as sensor2:
+        assert sensor2.resource == sensor.resource
+    assert len(probe_calls) == 1
+
+    lb.visa_clear_probe_cache()
+    assert not lb.visa_probe_cache_path().exists()